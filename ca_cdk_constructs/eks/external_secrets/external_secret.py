@@ -1,6 +1,6 @@
-from attr import define
-
 from typing import Union, Any
+
+from attr import define
 from cdk8s import ApiObjectMetadata
 from constructs import Construct
 
@@ -15,7 +15,7 @@ from ca_cdk_constructs.eks.imports.io.external_secrets import (
 )
 
 
-@define
+@define(slots=True, frozen=True)
 class ExternalSecretSource:
     """
     Container for secret references to be used by :class:`~ExternalSecret~`
@@ -74,15 +74,44 @@ class ExternalSecret(Construct):
         id: str,
         store_name: str,
         secret_source: ExternalSecretSource,
-        metadata: Union[dict[str, Any], ApiObjectMetadata] = {},
+        metadata: Union[dict[str, Any], ApiObjectMetadata, None] = None,
     ):
         super().__init__(scope, id)
         self._k8s_secret_name = secret_source.k8s_secret_name
 
+        if not secret_source.secret_mappings:
+            # an empty mapping would produce an ExternalSecret that syncs nothing;
+            # fail at synth time rather than on the cluster
+            raise ValueError("ExternalSecret requires at least one secret_mapping")
+
+        # bind the per-entry constructors and the source secret to locals to
+        # avoid repeated global/attribute lookups in the loop below
+        spec_data = ExternalSecretV1Beta1SpecData
+        remote_ref = ExternalSecretV1Beta1SpecDataRemoteRef
+        source_secret = secret_source.source_secret
+
+        data = []
+        for k, v in secret_source.secret_mappings.items():
+            if not v:
+                # if not specified, set the secret key = the last element of the
+                # potentially . separated provider key
+                v = k.rpartition(".")[2] or k
+            data.append(
+                spec_data(
+                    remote_ref=remote_ref(
+                        key=source_secret,
+                        # which property to retrieve from provider
+                        property=k,
+                    ),
+                    # the key in the K8s secret e.g. the env var name
+                    secret_key=v,
+                )
+            )
+
         ExternalSecretV1Beta1(
             self,
             "Resource",
-            metadata=metadata,
+            metadata=metadata if metadata is not None else {},
             spec=ExternalSecretV1Beta1Spec(
                 secret_store_ref=ExternalSecretV1Beta1SpecSecretStoreRef(
                     name=store_name,
@@ -90,19 +119,7 @@ class ExternalSecret(Construct):
                 ),
                 refresh_interval=secret_source.refresh_interval,
                 target=ExternalSecretV1Beta1SpecTarget(name=secret_source.k8s_secret_name),
-                data=[
-                    ExternalSecretV1Beta1SpecData(
-                        remote_ref=ExternalSecretV1Beta1SpecDataRemoteRef(
-                            key=secret_source.source_secret,
-                            # which property to retrieve from provider
-                            property=k,
-                        ),
-                        secret_key=v  # the key in the K8s secret e.g. the env var name
-                        or str(k).split(".")[-1],
-                        # if not specified, set the secret key = the last element of the pottentially . separated provider key
-                    )
-                    for k, v in secret_source.secret_mappings.items()
-                ],
+                data=data,
             ),
         )
 
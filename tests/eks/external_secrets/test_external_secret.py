@@ -1,3 +1,4 @@
+import pytest
 from cdk8s import App, Chart
 
 from ca_cdk_constructs.eks.external_secrets import (
@@ -25,3 +26,19 @@ def test_external_secret(snapshot):
     ExternalSecret(chart, "ExternalDatabaseSecret", store_name="aws-ssm", secret_source=source)
 
     assert app.synth_yaml() == snapshot
+
+
+def test_external_secret_requires_secret_mappings():
+    app = App()
+    chart = Chart(app, "ExternSecretsChart")
+
+    source = ExternalSecretSource(
+        source_secret="db-secret",
+        secret_mappings={},
+        k8s_secret_name="database-secret",
+    )
+
+    with pytest.raises(ValueError, match="at least one secret_mapping"):
+        ExternalSecret(
+            chart, "ExternalDatabaseSecret", store_name="aws-ssm", secret_source=source
+        )